@@ -18,7 +18,7 @@ echo Building executable...
 python build_exe.py
 
 echo.
-echo Build complete! Check the 'build' folder for your executable.
+echo Build complete! Check the 'release' folder for your executable.
 echo.
 pause
 
@@ -20,7 +20,7 @@ echo "Building executable..."
 python3 build_exe.py
 
 echo ""
-echo "Build complete! Check the 'build' folder for your executable."
+echo "Build complete! Check the 'release' folder for your executable."
 echo ""
 read -p "Press Enter to exit..."
 
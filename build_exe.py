@@ -8,8 +8,13 @@ import sys
 import subprocess
 import platform
 import shutil
+import argparse
+import importlib
 from pathlib import Path
 
+# Final distributable package; build/ is left to PyInstaller as its cache
+RELEASE_DIR = 'release'
+
 def get_platform_specs():
     """Get platform-specific build specifications"""
     system = platform.system().lower()
@@ -42,8 +47,13 @@ def get_platform_specs():
 
 def create_spec_file():
     """Create PyInstaller spec file for better control"""
+    # Only main.py ships as source (Streamlit runs it as a script); the other modules
+    # are already compiled into the PYZ. Sample files are copied next to the executable
+    # instead of being embedded, since the app never reads them.
     spec_content = '''# -*- mode: python ; coding: utf-8 -*-
 
+import sys
+
 block_cipher = None
 
 a = Analysis(
@@ -51,17 +61,20 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[
-        ('sample_files', 'sample_files'),
         ('assets', 'assets'),
-        ('*.py', '.'),
+        ('main.py', '.'),
     ],
     hiddenimports=[
         'streamlit',
         'pandas',
         'plotly',
         'pdfplumber',
+        'pypdfium2',
         'openpyxl',
+        'python_calamine',
+        'xlsxwriter',
         'reportlab',
+        'orjson',
         'streamlit.web.cli',
         'streamlit.runtime.scriptrunner',
         'streamlit.runtime.state',
@@ -70,7 +83,21 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'tkinter',
+        'matplotlib',
+        'IPython',
+        'notebook',
+        'jupyter',
+        'pytest',
+        'setuptools._distutils',
+        'PIL.ImageQt',
+        'PyQt5',
+        'PySide2',
+        'sphinx',
+        'pydoc_data',
+        'tests',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -89,9 +116,10 @@ exe = EXE(
     name='MyLittleAccountant',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
+    strip=sys.platform.startswith('linux'),  # stripping Mach-O breaks macOS code signatures
     upx=True,
-    upx_exclude=[],
+    # Plain file names (PyInstaller does not expand globs here): the CRT and the building Python's DLLs
+    upx_exclude=['vcruntime140.dll', 'python3.dll', f'python3{sys.version_info.minor}.dll'],
     runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
@@ -118,11 +146,16 @@ def install_dependencies():
         print("Installing PyInstaller...")
         subprocess.run([sys.executable, '-m', 'pip', 'install', 'pyinstaller'], check=True)
     
-    # Install other dependencies
-    subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'], check=True)
+    # Install other dependencies - uv downloads and installs wheels in parallel
+    uv_path = shutil.which('uv')
+    if uv_path:
+        print("Using uv for parallel install...")
+        subprocess.run([uv_path, 'pip', 'install', '--python', sys.executable, '-r', 'requirements.txt'], check=True)
+    else:
+        subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'], check=True)
 
-def build_executable():
-    """Build the executable"""
+def build_executable(fresh=False):
+    """Build the executable (incremental unless fresh is set)"""
     system = platform.system().lower()
     specs = get_platform_specs()
     
@@ -131,30 +164,46 @@ def build_executable():
     # Create directories
     os.makedirs('build', exist_ok=True)
     os.makedirs('dist', exist_ok=True)
+    os.makedirs(RELEASE_DIR, exist_ok=True)
     
     # Create spec file
     create_spec_file()
     
-    # Build command
-    build_cmd = [
-        sys.executable, '-m', 'PyInstaller',
-        '--clean',
+    # Build arguments - reuse PyInstaller's cache unless a fresh build is requested
+    build_args = [
         '--noconfirm',
         'MyLittleAccountant.spec'
     ]
+    if fresh:
+        build_args.insert(0, '--clean')
+    
+    # Compress binaries with UPX when it is available
+    upx_path = shutil.which('upx')
+    if upx_path:
+        build_args.extend(['--upx-dir', os.path.dirname(upx_path)])
+    else:
+        print("UPX not found - building without executable compression")
     
     # Add platform-specific arguments
     if specs['icon'] and os.path.exists(specs['icon']):
-        build_cmd.extend(['--icon', specs['icon']])
+        build_args.extend(['--icon', specs['icon']])
     
-    print(f"Running: {' '.join(build_cmd)}")
+    print(f"Running: pyinstaller {' '.join(build_args)}")
     
     try:
-        result = subprocess.run(build_cmd, check=True, capture_output=True, text=True)
+        # Run PyInstaller in-process: no interpreter restart, and full tracebacks on failure.
+        # It may have just been pip-installed, so refresh the import system's caches first.
+        importlib.invalidate_caches()
+        import PyInstaller.__main__
+        try:
+            PyInstaller.__main__.run(build_args)
+        except SystemExit as e:
+            # PyInstaller reports fatal errors by calling sys.exit
+            if e.code not in (None, 0):
+                raise RuntimeError(e.code) from e
         print("Build successful!")
-        print(result.stdout)
         
-        # Move executable to build directory
+        # Move executable to release directory
         if system == 'windows':
             exe_name = f"{specs['name']}.exe"
         elif system == 'darwin':
@@ -162,30 +211,47 @@ def build_executable():
         else:
             exe_name = specs['name']
         
+        release_path = os.path.join(RELEASE_DIR, exe_name)
         if os.path.exists(f"dist/{exe_name}"):
-            shutil.move(f"dist/{exe_name}", f"build/{exe_name}")
-            print(f"Executable created: build/{exe_name}")
+            if os.path.isdir(release_path):
+                shutil.rmtree(release_path)
+            elif os.path.exists(release_path):
+                os.remove(release_path)
+            shutil.move(f"dist/{exe_name}", release_path)
+            print(f"Executable created: {release_path}")
         
-        # Clean up
-        if os.path.exists('dist'):
-            shutil.rmtree('dist')
-        if os.path.exists('build'):
-            # Keep only the executable
-            for item in os.listdir('build'):
-                if item != exe_name:
-                    item_path = os.path.join('build', item)
-                    if os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
-                    else:
-                        os.remove(item_path)
+        # Keep build/ intact so PyInstaller can reuse its Analysis/PYZ caches next time
         
         return True
         
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"Build failed: {e}")
-        print(f"Error output: {e.stderr}")
         return False
 
+def fast_copytree(src, dst):
+    """Copy a directory tree, skipping files whose copy is already up to date"""
+    os.makedirs(dst, exist_ok=True)
+    
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                fast_copytree(entry.path, target)
+                continue
+            
+            src_stat = entry.stat()
+            try:
+                dst_stat = os.stat(target)
+                if (dst_stat.st_size == src_stat.st_size and
+                        int(dst_stat.st_mtime) == int(src_stat.st_mtime)):
+                    continue
+            except FileNotFoundError:
+                pass
+            
+            # copy2 keeps mtimes for the check above and uses the OS fast-copy
+            # (sendfile/fcopyfile/CopyFile) under the hood
+            shutil.copy2(entry.path, target)
+
 def create_launcher_scripts():
     """Create launcher scripts for different platforms"""
     
@@ -201,7 +267,7 @@ MyLittleAccountant.exe
 pause
 '''
     
-    with open('build/setup.bat', 'w') as f:
+    with open(os.path.join(RELEASE_DIR, 'setup.bat'), 'w') as f:
         f.write(windows_script)
     
     # macOS/Linux shell script
@@ -220,12 +286,12 @@ chmod +x MyLittleAccountant
 ./MyLittleAccountant
 '''
     
-    with open('build/setup.sh', 'w') as f:
+    with open(os.path.join(RELEASE_DIR, 'setup.sh'), 'w') as f:
         f.write(unix_script)
     
     # Make shell script executable
     if platform.system().lower() != 'windows':
-        os.chmod('build/setup.sh', 0o755)
+        os.chmod(os.path.join(RELEASE_DIR, 'setup.sh'), 0o755)
 
 def create_readme():
     """Create README for the build"""
@@ -291,11 +357,19 @@ def create_readme():
 **My Little Accountant** - Making personal finance simple for everyone! 💰
 '''
     
-    with open('build/README.md', 'w') as f:
+    with open(os.path.join(RELEASE_DIR, 'README.md'), 'w') as f:
         f.write(readme_content)
 
 def main():
     """Main build function"""
+    parser = argparse.ArgumentParser(description="Build the My Little Accountant executable")
+    parser.add_argument(
+        '--fresh',
+        action='store_true',
+        help="Discard PyInstaller's cache and rebuild from scratch (passes --clean)"
+    )
+    args = parser.parse_args()
+    
     print("=== My Little Accountant - Executable Builder ===")
     print()
     
@@ -313,7 +387,7 @@ def main():
         os.makedirs('sample_files', exist_ok=True)
         
         # Build executable
-        if build_executable():
+        if build_executable(fresh=args.fresh):
             print("\n✅ Build completed successfully!")
             
             # Create launcher scripts
@@ -324,11 +398,11 @@ def main():
             
             # Copy sample files
             if os.path.exists('sample_files'):
-                shutil.copytree('sample_files', 'build/sample_files', dirs_exist_ok=True)
+                fast_copytree('sample_files', os.path.join(RELEASE_DIR, 'sample_files'))
             
-            print("\n📦 Executable package created in 'build/' directory")
+            print(f"\n📦 Executable package created in '{RELEASE_DIR}/' directory")
             print("\n🎉 Ready to distribute! Users can:")
-            print("   1. Download the build folder as ZIP")
+            print(f"   1. Download the {RELEASE_DIR} folder as ZIP")
             print("   2. Extract anywhere")
             print("   3. Double-click setup.bat/setup.sh")
             print("   4. Browser opens automatically!")
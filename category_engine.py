@@ -5,9 +5,15 @@ Handles automatic and manual categorization of transactions
 
 import pandas as pd
 import re
+import functools
 from typing import Dict, List, Tuple, Optional
 import logging
 
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup; falls back to a ranked keyword scan
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 class CategoryEngine:
@@ -106,24 +112,82 @@ class CategoryEngine:
         for category, data in self.categories.items():
             for keyword in data['keywords']:
                 self.keyword_to_category[keyword.lower()] = category
+        
+        # Flat color lookup, reused on every rerender
+        self._color_map = {cat: data['color'] for cat, data in self.categories.items()}
+        
+        # Fixed category set lets the Category column use compact integer codes;
+        # category_names is the same list, prebuilt for UI option lists
+        self.category_names = tuple(self.categories)
+        self.category_dtype = pd.CategoricalDtype(categories=list(self.category_names))
+        
+        # Keyword matchers (ordered keyword list, plus Aho-Corasick if available)
+        self._ranked_keywords = []
+        self._automaton = None
+        self._build_matchers()
+    
+    def _build_matchers(self):
+        """Build keyword matchers; the longest matching keyword wins, then category order"""
+        priority = {category: i for i, category in enumerate(self.categories)}
+        
+        # Rank keywords most-specific first so 'gas bill' beats 'gas' deterministically
+        self._ranked_keywords = sorted(
+            (-len(keyword), priority[category], keyword, category)
+            for keyword, category in self.keyword_to_category.items()
+        )
+        
+        self._automaton = None
+        if ahocorasick is not None and self._ranked_keywords:
+            automaton = ahocorasick.Automaton()
+            for rank, (_, _, keyword, category) in enumerate(self._ranked_keywords):
+                automaton.add_word(keyword, (rank, category))
+            automaton.make_automaton()
+            self._automaton = automaton
+        
+        # Keyword -> categories for get_suggestions (a keyword such as 'amazon' can
+        # belong to several); all hits count, overlapping ones included
+        suggestion_categories = {}
+        for category, data in self.categories.items():
+            if category == 'Other':
+                continue
+            for keyword in data['keywords']:
+                suggestion_categories.setdefault(keyword, []).append(category)
+        
+        self._suggestion_keywords = suggestion_categories
+        self._suggestion_automaton = None
+        if ahocorasick is not None and suggestion_categories:
+            automaton = ahocorasick.Automaton()
+            for keyword, categories in suggestion_categories.items():
+                automaton.add_word(keyword, (keyword, categories))
+            automaton.make_automaton()
+            self._suggestion_automaton = automaton
+        
+        # Descriptions repeat heavily across statements; memoize the keyword lookup.
+        # Rebuilding the matchers replaces the cache, so stale results are dropped.
+        self._match_category_cached = functools.lru_cache(maxsize=50_000)(self._match_category)
+    
+    def _match_category(self, desc_lower: str) -> Optional[str]:
+        """Return the category of the most specific keyword found in the description"""
+        if self._automaton is not None:
+            hits = [value for _, value in self._automaton.iter(desc_lower)]
+            return min(hits)[1] if hits else None
+        
+        for _, _, keyword, category in self._ranked_keywords:
+            if keyword in desc_lower:
+                return category
+        return None
     
-    def categorize_transaction(self, description: str, amount: float = None) -> str:
+    def categorize_transaction(self, description: str, amount: Optional[float] = None) -> str:
         """Categorize a single transaction based on description"""
         if not description:
             return 'Other'
         
         desc_lower = description.lower()
         
-        # Check for exact keyword matches
-        for keyword, category in self.keyword_to_category.items():
-            if keyword in desc_lower:
-                return category
-        
-        # Check for partial matches (for compound words)
-        words = desc_lower.split()
-        for word in words:
-            if word in self.keyword_to_category:
-                return self.keyword_to_category[word]
+        # Single pass over the description for all keywords
+        category = self._match_category_cached(desc_lower)
+        if category is not None:
+            return category
         
         # Amount-based categorization for common patterns
         if amount is not None:
@@ -143,45 +207,80 @@ class CategoryEngine:
             df['Category'] = ''
         
         # Only categorize uncategorized transactions
-        uncategorized_mask = (df['Category'].isna()) | (df['Category'] == '') | (df['Category'] == 'Other')
+        uncategorized_mask = df['Category'].isna() | df['Category'].isin(['', 'Other'])
+        
+        if uncategorized_mask.any():
+            desc = df.loc[uncategorized_mask, 'Description'].fillna('').astype(str).str.lower()
+            # Keyword lookup runs once per distinct description thanks to the cache
+            result = desc.map(self._match_category_cached)
+            
+            # Amount-based fallback for unmatched, non-empty descriptions
+            if 'Amount' in df.columns:
+                amounts = pd.to_numeric(df.loc[uncategorized_mask, 'Amount'], errors='coerce')
+                is_income = result.isna() & (desc != '') & (amounts > 1000)
+                result[is_income] = 'Income'
+            
+            self._sync_category_dtype(df)
+            df.loc[uncategorized_mask, 'Category'] = result.fillna('Other')
         
-        for idx in df[uncategorized_mask].index:
-            description = df.loc[idx, 'Description']
-            amount = df.loc[idx, 'Amount'] if 'Amount' in df.columns else None
-            category = self.categorize_transaction(description, amount)
-            df.loc[idx, 'Category'] = category
+        df['Category'] = df['Category'].astype(self.category_dtype_for(df['Category']))
         
         return df
     
+    def category_dtype_for(self, values: pd.Series) -> pd.CategoricalDtype:
+        """Engine categories, followed by any other labels already used in values"""
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            labels = values.cat.categories
+        else:
+            labels = pd.Index(values.dropna().unique())
+        
+        # Labels from imported or older data are kept rather than cast to NaN
+        extra = labels.difference(pd.Index(self.category_names), sort=False)
+        if extra.empty:
+            return self.category_dtype
+        return pd.CategoricalDtype(categories=list(self.category_names) + extra.tolist())
+    
+    def _sync_category_dtype(self, df: pd.DataFrame):
+        """Bring a categorical Category column up to date with the engine's categories"""
+        if isinstance(df['Category'].dtype, pd.CategoricalDtype):
+            dtype = self.category_dtype_for(df['Category'])
+            if df['Category'].dtype != dtype:
+                df['Category'] = df['Category'].astype(dtype)
+    
     def get_category_stats(self, df: pd.DataFrame) -> Dict[str, Dict]:
         """Get statistics for each category"""
         if 'Category' not in df.columns:
             return {}
         
-        stats = {}
+        return self.get_category_stats_frame(df).to_dict('index')
+    
+    def get_category_stats_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Get statistics for each category as a DataFrame indexed by category"""
+        if 'Category' not in df.columns:
+            return pd.DataFrame(columns=['count', 'total_amount', 'income_amount', 'expense_amount', 'color'])
+        
+        # One pass: split amounts into positive/negative parts, then aggregate per category
+        amounts = df['Amount']
+        grouped = pd.DataFrame({
+            'count': 1,
+            'total': amounts,
+            'income': amounts.where(amounts > 0, 0),
+            'expense': -amounts.where(amounts < 0, 0)
+        }).groupby(df['Category'], sort=False, observed=True).sum()
         
-        for category in self.categories.keys():
-            category_data = df[df['Category'] == category]
-            
-            if len(category_data) > 0:
-                total_amount = category_data['Amount'].sum()
-                transaction_count = len(category_data)
-                
-                # Determine if it's income or expense
-                if category == 'Income':
-                    income_amount = total_amount
-                    expense_amount = 0
-                else:
-                    income_amount = category_data[category_data['Amount'] > 0]['Amount'].sum()
-                    expense_amount = abs(category_data[category_data['Amount'] < 0]['Amount'].sum())
-                
-                stats[category] = {
-                    'count': transaction_count,
-                    'total_amount': total_amount,
-                    'income_amount': income_amount,
-                    'expense_amount': expense_amount,
-                    'color': self.categories[category]['color']
-                }
+        # Known categories only, in the engine's order
+        grouped.index = grouped.index.astype(object)
+        grouped = grouped.reindex(pd.Index(self.category_names).intersection(grouped.index, sort=False))
+        
+        # Income counts its full total as income; other categories split by sign
+        is_income = grouped.index == 'Income'
+        stats = pd.DataFrame({
+            'count': grouped['count'].astype(int),
+            'total_amount': grouped['total'],
+            'income_amount': grouped['total'].where(is_income, grouped['income']),
+            'expense_amount': grouped['expense'].where(~is_income, 0),
+            'color': grouped.index.map(self._color_map)
+        }, index=grouped.index)
         
         return stats
     
@@ -190,26 +289,38 @@ class CategoryEngine:
         if category not in self.categories:
             raise ValueError(f"Unknown category: {category}")
         
+        if 'Category' in df.columns:
+            self._sync_category_dtype(df)
         df.loc[indices, 'Category'] = category
         return df
     
-    def get_suggestions(self, description: str, current_category: str = None) -> List[Tuple[str, float]]:
+    def get_suggestions(self, description: str, current_category: Optional[str] = None) -> List[Tuple[str, float]]:
         """Get category suggestions for a description with confidence scores"""
         if not description:
             return []
         
-        suggestions = []
         desc_lower = description.lower()
         
+        # Distinct keywords in the description; the automaton reports overlapping hits,
+        # so 'gas bill' also finds 'gas'
+        if self._suggestion_automaton is not None:
+            found = {keyword: categories for _, (keyword, categories) in self._suggestion_automaton.iter(desc_lower)}
+        else:
+            found = {keyword: categories for keyword, categories in self._suggestion_keywords.items() if keyword in desc_lower}
+        matched = {category for categories in found.values() for category in categories}
+        
+        suggestions = []
+        words = desc_lower.split()
         for category, data in self.categories.items():
-            if category == 'Other':
+            if category not in matched:
                 continue
             
+            # Score only the categories with a keyword hit
             confidence = 0
             keyword_matches = 0
             
             for keyword in data['keywords']:
-                if keyword in desc_lower:
+                if keyword in found:
                     # Exact match gets higher confidence
                     if keyword == desc_lower:
                         confidence += 1.0
@@ -218,37 +329,49 @@ class CategoryEngine:
                     keyword_matches += 1
             
             # Partial word matches
-            words = desc_lower.split()
             for word in words:
                 for keyword in data['keywords']:
                     if word in keyword or keyword in word:
                         confidence += 0.3
             
             # Normalize confidence
-            if keyword_matches > 0:
-                confidence = min(confidence / keyword_matches, 1.0)
-                
-                if confidence > 0.2:  # Only suggest if confidence > 20%
-                    suggestions.append((category, confidence))
+            confidence = min(confidence / keyword_matches, 1.0)
+            if confidence > 0.2:  # Only suggest if confidence > 20%
+                suggestions.append((category, confidence))
         
         # Sort by confidence
         suggestions.sort(key=lambda x: x[1], reverse=True)
         return suggestions[:3]  # Return top 3 suggestions
     
+    def suggest_categories(self, descriptions: pd.Series) -> pd.Series:
+        """Best suggested category for each description (None where nothing is suggested)"""
+        # Score each distinct description once, then map the results back onto the rows
+        codes, uniques = pd.factorize(descriptions.fillna('').astype(str))
+        best = []
+        for description in uniques:
+            suggestions = self.get_suggestions(description)
+            best.append(suggestions[0][0] if suggestions else None)
+        
+        return pd.Series(pd.Series(best, dtype=object).to_numpy()[codes], index=descriptions.index, dtype=object)
+    
     def add_custom_category(self, name: str, keywords: List[str], color: str = '#6c757d'):
         """Add a custom category"""
         self.categories[name] = {
             'keywords': keywords,
             'color': color
         }
+        self._color_map[name] = color
         
         # Update keyword lookup
         for keyword in keywords:
             self.keyword_to_category[keyword.lower()] = name
+        self.category_names = tuple(self.categories)
+        self.category_dtype = pd.CategoricalDtype(categories=list(self.category_names))
+        self._build_matchers()
     
     def get_category_colors(self) -> Dict[str, str]:
         """Get color mapping for all categories"""
-        return {cat: data['color'] for cat, data in self.categories.items()}
+        return self._color_map
     
     def get_progress_stats(self, df: pd.DataFrame) -> Dict[str, any]:
         """Get categorization progress statistics"""
@@ -261,7 +384,7 @@ class CategoryEngine:
             }
         
         total = len(df)
-        uncategorized = len(df[(df['Category'].isna()) | (df['Category'] == '')])
+        uncategorized = int(((df['Category'].isna()) | (df['Category'] == '')).sum())
         categorized = total - uncategorized
         
         return {
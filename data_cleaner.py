@@ -6,139 +6,151 @@ Handles date parsing, amount standardization, and data validation
 import pandas as pd
 import re
 from typing import List, Dict, Tuple, Optional
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Date format patterns, with the field order of their capture groups
+_DATE_PATTERNS = [
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), ('month', 'day', 'year')),  # MM/DD/YYYY or M/D/YYYY
+    (re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})'), ('month', 'day', 'year')),  # MM-DD-YYYY
+    (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'), ('year', 'month', 'day')),  # YYYY-MM-DD
+    (re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})'), ('month', 'day', 'year')),  # MM.DD.YYYY
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{2})'), ('month', 'day', 'yy')),     # MM/DD/YY
+]
+
+# Amount cleaning patterns
+_AMOUNT_PATTERNS = [
+    re.compile(r'([\d,]+\.\d{2})'),  # 1,234.56
+    re.compile(r'([\d,]+\.\d{1})'),  # 1,234.5
+    re.compile(r'([\d,]+)'),         # 1,234
+]
+
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+_CURRENCY_RE = re.compile(r'[$£€¥]')
+_WS_RE = re.compile(r'\s+')
+_NEGATIVE_MARKS_RE = re.compile(r'[-()]')
+_PREFIX_RE = re.compile(r'^(DEBIT|CREDIT|DR|CR)\s*', re.IGNORECASE)
+_SUFFIX_RE = re.compile(r'\s*(DEBIT|CREDIT|DR|CR)$', re.IGNORECASE)
+
 class DataCleaner:
     """Cleans and standardizes financial transaction data"""
     
     def __init__(self):
-        # Date format patterns
-        self.date_patterns = [
-            r'\d{1,2}/\d{1,2}/\d{4}',  # MM/DD/YYYY or M/D/YYYY
-            r'\d{1,2}-\d{1,2}-\d{4}',  # MM-DD-YYYY
-            r'\d{4}-\d{1,2}-\d{1,2}',  # YYYY-MM-DD
-            r'\d{1,2}\.\d{1,2}\.\d{4}',  # MM.DD.YYYY
-            r'\d{1,2}/\d{1,2}/\d{2}',   # MM/DD/YY
-        ]
-        
-        # Amount cleaning patterns
-        self.amount_patterns = [
-            r'[\d,]+\.\d{2}',  # 1,234.56
-            r'[\d,]+\.\d{1}',  # 1,234.5
-            r'[\d,]+',         # 1,234
-        ]
+        self.date_patterns = _DATE_PATTERNS
+        self.amount_patterns = _AMOUNT_PATTERNS
     
     def clean_date(self, date_str: str) -> Optional[str]:
         """Clean and standardize date format"""
-        if pd.isna(date_str) or not isinstance(date_str, str):
+        if pd.isna(date_str):
             return None
         
-        date_str = str(date_str).strip()
+        cleaned = self.clean_date_series(pd.Series([date_str], dtype=object)).iloc[0]
+        return None if pd.isna(cleaned) else cleaned.strftime('%Y-%m-%d')
+    
+    def clean_date_series(self, dates: pd.Series) -> pd.Series:
+        """Vectorized date cleaning: parse each value to a datetime64 (NaT if invalid)"""
+        # Already-parsed columns (e.g. from the PDF processor) need no string parsing
+        if pd.api.types.is_datetime64_dtype(dates):
+            return dates.astype('datetime64[ns]')
         
-        # Try to parse different date formats
-        for pattern in self.date_patterns:
-            match = re.search(pattern, date_str)
-            if match:
-                date_part = match.group()
-                
-                # Parse the date
-                try:
-                    # Handle MM/DD/YYYY format
-                    if '/' in date_part:
-                        parts = date_part.split('/')
-                        if len(parts) == 3:
-                            month, day, year = parts
-                            if len(year) == 2:  # Convert YY to YYYY
-                                year = '20' + year if int(year) < 50 else '19' + year
-                            
-                            # Ensure month and day are 2 digits
-                            month = month.zfill(2)
-                            day = day.zfill(2)
-                            
-                            # Validate date
-                            parsed_date = datetime(int(year), int(month), int(day))
-                            return parsed_date.strftime('%Y-%m-%d')
-                    
-                    # Handle MM-DD-YYYY format
-                    elif '-' in date_part:
-                        parts = date_part.split('-')
-                        if len(parts) == 3:
-                            if len(parts[0]) == 4:  # YYYY-MM-DD
-                                year, month, day = parts
-                            else:  # MM-DD-YYYY
-                                month, day, year = parts
-                            
-                            month = month.zfill(2)
-                            day = day.zfill(2)
-                            
-                            parsed_date = datetime(int(year), int(month), int(day))
-                            return parsed_date.strftime('%Y-%m-%d')
-                    
-                    # Handle MM.DD.YYYY format
-                    elif '.' in date_part:
-                        parts = date_part.split('.')
-                        if len(parts) == 3:
-                            month, day, year = parts
-                            month = month.zfill(2)
-                            day = day.zfill(2)
-                            
-                            parsed_date = datetime(int(year), int(month), int(day))
-                            return parsed_date.strftime('%Y-%m-%d')
-                
-                except (ValueError, IndexError):
-                    continue
+        present = dates.notna().to_numpy()
+        text = dates[present].astype(str).str.strip()
+        
+        # Statement dates repeat heavily, so parse each distinct string only once
+        unique_text = pd.Series(text.unique(), dtype=object)
+        parsed = pd.Series(pd.NaT, index=unique_text.index, dtype='datetime64[ns]')
+        
+        # Exact YYYY-MM-DD strings (our own export format) go through pandas' C ISO-8601 parser
+        iso_text = unique_text[unique_text.str.fullmatch(_ISO_DATE_RE)]
+        if not iso_text.empty:
+            parsed.loc[iso_text.index] = pd.to_datetime(iso_text, format='%Y-%m-%d', errors='coerce')
         
-        return None
+        # Try each format in order on the values that are still unparsed
+        for pattern, fields in self.date_patterns:
+            remaining = unique_text[parsed.isna()]
+            if remaining.empty:
+                break
+            
+            parts = remaining.str.extract(pattern).dropna()
+            if parts.empty:
+                continue
+            parts.columns = list(fields)
+            parts = parts.astype(int)
+            
+            # Convert YY to YYYY
+            if 'yy' in parts.columns:
+                parts['year'] = parts['yy'].where(parts['yy'] >= 50, parts['yy'] + 100) + 1900
+            
+            # Invalid dates (e.g. month 13) coerce to NaT and fall through to the next format
+            parsed.loc[parts.index] = pd.to_datetime(parts[['year', 'month', 'day']], errors='coerce')
+        
+        # Map back to every row by position in the unique values
+        codes = pd.Index(unique_text).get_indexer(text)
+        cleaned = pd.Series(pd.NaT, index=dates.index, dtype='datetime64[ns]')
+        cleaned[present] = parsed.to_numpy()[codes]
+        return cleaned
     
     def clean_amount(self, amount_str) -> Optional[float]:
         """Clean and standardize amount format"""
         if pd.isna(amount_str):
             return None
         
-        # Convert to string and clean
-        amount_str = str(amount_str).strip()
+        cleaned = self.clean_amount_series(pd.Series([amount_str], dtype=object)).iloc[0]
+        return None if pd.isna(cleaned) else cleaned
+    
+    def clean_amount_series(self, amounts: pd.Series) -> pd.Series:
+        """Vectorized amount cleaning: parse each value to a float (NaN if invalid)"""
+        # Already-numeric columns (the usual CSV/Excel case) need no string parsing
+        if pd.api.types.is_numeric_dtype(amounts) and not pd.api.types.is_bool_dtype(amounts):
+            return amounts.astype(float)
+        
+        values = amounts.reset_index(drop=True)
+        text = values[values.notna()].astype(str).str.strip()
         
         # Remove currency symbols and extra spaces
-        amount_str = re.sub(r'[$£€¥]', '', amount_str)
-        amount_str = re.sub(r'\s+', '', amount_str)
+        text = text.str.replace(_CURRENCY_RE, '', regex=True).str.replace(_WS_RE, '', regex=True)
         
         # Handle negative amounts
-        is_negative = False
-        if amount_str.startswith('-') or amount_str.startswith('(') and amount_str.endswith(')'):
-            is_negative = True
-            amount_str = amount_str.replace('-', '').replace('(', '').replace(')', '')
+        is_negative = text.str.startswith('-') | (text.str.startswith('(') & text.str.endswith(')'))
+        text = text.where(~is_negative, text.str.replace(_NEGATIVE_MARKS_RE, '', regex=True))
         
-        # Extract numeric part
+        # Extract numeric part, trying each pattern on the values still unparsed
+        parsed = pd.Series(float('nan'), index=text.index, dtype=float)
         for pattern in self.amount_patterns:
-            match = re.search(pattern, amount_str)
-            if match:
-                numeric_str = match.group().replace(',', '')
-                try:
-                    amount = float(numeric_str)
-                    return -amount if is_negative else amount
-                except ValueError:
-                    continue
-        
-        return None
+            remaining = text[parsed.isna()]
+            if remaining.empty:
+                break
+            
+            numeric = remaining.str.extract(pattern, expand=False).dropna()
+            parsed.loc[numeric.index] = pd.to_numeric(numeric.str.replace(',', '', regex=False), errors='coerce')
+        
+        parsed = parsed.where(~is_negative, -parsed)
+        
+        cleaned = parsed.reindex(values.index)
+        cleaned.index = amounts.index
+        return cleaned
     
     def clean_description(self, desc_str: str) -> str:
         """Clean and standardize description"""
         if pd.isna(desc_str):
             return ""
         
-        desc_str = str(desc_str).strip()
+        return self.clean_description_series(pd.Series([desc_str], dtype=object)).iloc[0]
+    
+    def clean_description_series(self, descriptions: pd.Series) -> pd.Series:
+        """Vectorized description cleaning"""
+        cleaned = descriptions.fillna('').astype(str).str.strip()
         
         # Remove extra whitespace
-        desc_str = re.sub(r'\s+', ' ', desc_str)
+        cleaned = cleaned.str.replace(_WS_RE, ' ', regex=True)
         
         # Remove common prefixes/suffixes
-        desc_str = re.sub(r'^(DEBIT|CREDIT|DR|CR)\s*', '', desc_str, flags=re.IGNORECASE)
-        desc_str = re.sub(r'\s*(DEBIT|CREDIT|DR|CR)$', '', desc_str, flags=re.IGNORECASE)
+        cleaned = cleaned.str.replace(_PREFIX_RE, '', regex=True)
+        cleaned = cleaned.str.replace(_SUFFIX_RE, '', regex=True)
         
-        return desc_str.strip()
+        return cleaned.str.strip()
     
     def clean_dataframe(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, List[str]]]:
         """Clean entire DataFrame and return issues found"""
@@ -149,51 +161,62 @@ class DataCleaner:
             'duplicates': []
         }
         
-        # Create a copy to avoid modifying original
-        cleaned_df = df.copy()
+        # Collect rewritten columns; they are written into the one filtered copy at the end
+        changes = {}
         
         # Clean dates
-        if 'Date' in cleaned_df.columns:
-            cleaned_df['Date'] = cleaned_df['Date'].apply(self.clean_date)
-            invalid_dates = cleaned_df[cleaned_df['Date'].isna()].index.tolist()
+        if 'Date' in df.columns:
+            changes['Date'] = self.clean_date_series(df['Date'])
+            invalid_dates = df.index[changes['Date'].isna().to_numpy()].tolist()
             issues['invalid_dates'] = invalid_dates
         
         # Clean amounts
-        if 'Amount' in cleaned_df.columns:
-            cleaned_df['Amount'] = cleaned_df['Amount'].apply(self.clean_amount)
-            invalid_amounts = cleaned_df[cleaned_df['Amount'].isna()].index.tolist()
+        if 'Amount' in df.columns:
+            changes['Amount'] = self.clean_amount_series(df['Amount'])
+            invalid_amounts = df.index[changes['Amount'].isna().to_numpy()].tolist()
             issues['invalid_amounts'] = invalid_amounts
         
         # Clean descriptions
-        if 'Description' in cleaned_df.columns:
-            cleaned_df['Description'] = cleaned_df['Description'].apply(self.clean_description)
-            empty_descriptions = cleaned_df[cleaned_df['Description'] == ''].index.tolist()
+        if 'Description' in df.columns:
+            changes['Description'] = self.clean_description_series(df['Description'])
+            empty_descriptions = df.index[(changes['Description'] == '').to_numpy()].tolist()
             issues['empty_descriptions'] = empty_descriptions
         
         # Detect potential duplicates
-        if all(col in cleaned_df.columns for col in ['Date', 'Amount', 'Description']):
-            # Create a hash for each transaction
-            cleaned_df['_hash'] = (
-                cleaned_df['Date'].astype(str) + 
-                cleaned_df['Amount'].astype(str) + 
-                cleaned_df['Description'].astype(str)
-            ).str.lower()
+        if all(col in changes for col in ['Date', 'Amount', 'Description']):
+            # Compare descriptions case-insensitively as integer codes: lowercase only the
+            # distinct strings, then map each row's code onto its lowercased group
+            codes, uniques = pd.factorize(changes['Description'], use_na_sentinel=False)
+            lower_codes, _ = pd.factorize(pd.Index(uniques).astype(str).str.lower())
+            duplicate_keys = pd.DataFrame({
+                'Date': changes['Date'],
+                'Amount': changes['Amount'],
+                'Description': lower_codes[codes]
+            })
             
             # Find duplicates
-            duplicates = cleaned_df[cleaned_df.duplicated(subset=['_hash'], keep=False)].index.tolist()
-            issues['duplicates'] = duplicates
-            
-            # Remove the hash column
-            cleaned_df = cleaned_df.drop('_hash', axis=1)
+            duplicate_mask = duplicate_keys.duplicated(keep=False)
+            issues['duplicates'] = df.index[duplicate_mask.to_numpy()].tolist()
         
-        # Remove rows with critical missing data
-        before_count = len(cleaned_df)
-        cleaned_df = cleaned_df.dropna(subset=['Date', 'Amount'])
+        # Remove rows with critical missing data. The row filter makes the only copy of
+        # the frame; the cleaned columns then replace the originals in that copy
+        before_count = len(df)
+        if 'Date' in changes and 'Amount' in changes:
+            keep = (changes['Date'].notna() & changes['Amount'].notna()).to_numpy()
+            cleaned_df = df.take(keep.nonzero()[0])
+            for column, values in changes.items():
+                cleaned_df[column] = values[keep]
+        else:
+            cleaned_df = df.assign(**changes).dropna(subset=['Date', 'Amount'])
         after_count = len(cleaned_df)
         
         if before_count != after_count:
             issues['removed_rows'] = before_count - after_count
         
+        # Store categories as integer codes for the filter/groupby paths downstream
+        if 'Category' in cleaned_df.columns:
+            cleaned_df['Category'] = cleaned_df['Category'].astype('category')
+        
         return cleaned_df, issues
     
     def validate_data(self, df: pd.DataFrame) -> Dict[str, any]:
@@ -213,7 +236,9 @@ class DataCleaner:
         
         # Date range
         if 'Date' in df.columns and not df['Date'].isna().all():
-            valid_dates = pd.to_datetime(df['Date'], errors='coerce')
+            valid_dates = df['Date']
+            if not pd.api.types.is_datetime64_any_dtype(valid_dates):
+                valid_dates = pd.to_datetime(valid_dates, errors='coerce')
             valid_dates = valid_dates.dropna()
             if len(valid_dates) > 0:
                 validation['date_range'] = {
@@ -225,18 +250,21 @@ class DataCleaner:
         if 'Amount' in df.columns and not df['Amount'].isna().all():
             amounts = df['Amount'].dropna()
             if len(amounts) > 0:
+                # Every figure comes from reductions over one float64 array; net
+                # is the plain sum, so expenses need no second clipped copy
+                values = amounts.to_numpy(dtype=float)
+                net = values.sum()
                 validation['amount_range'] = {
-                    'min': amounts.min(),
-                    'max': amounts.max(),
-                    'mean': amounts.mean()
+                    'min': values.min(),
+                    'max': values.max(),
+                    'mean': net / len(values)
                 }
                 
                 # Income vs expenses
-                income = amounts[amounts > 0].sum()
-                expenses = abs(amounts[amounts < 0].sum())
+                income = values.clip(min=0).sum()
                 validation['total_income'] = income
-                validation['total_expenses'] = expenses
-                validation['net_flow'] = income - expenses
+                validation['total_expenses'] = income - net
+                validation['net_flow'] = net
         
         return validation
 
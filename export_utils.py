@@ -4,124 +4,172 @@ Handles exporting data to CSV, Excel, and PDF formats
 """
 
 import pandas as pd
+import numpy as np
+import io
 import os
 import zipfile
 import json
+import orjson
+from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-import plotly.graph_objects as go
-import plotly.express as px
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:  # Optional; CSV export and auto-save fall back to pandas/JSON
+    pyarrow = None
 
 logger = logging.getLogger(__name__)
 
-class ExportManager:
-    """Handles exporting financial data to various formats"""
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+@functools.lru_cache(maxsize=None)
+def _report_styles() -> Dict:
+    """Build the shared PDF report styles once, importing reportlab on first use"""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    from reportlab.lib import colors
+    
+    default_style = getSampleStyleSheet()
     
-    def __init__(self):
-        self.default_style = getSampleStyleSheet()
-        self.title_style = ParagraphStyle(
+    # Shared table look; the tables differ only in font size
+    table_commands = [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]
+    
+    return {
+        'default': default_style,
+        'title': ParagraphStyle(
             'CustomTitle',
-            parent=self.default_style['Heading1'],
+            parent=default_style['Heading1'],
             fontSize=18,
             spaceAfter=30,
             alignment=1  # Center alignment
-        )
-        self.heading_style = ParagraphStyle(
+        ),
+        'heading': ParagraphStyle(
             'CustomHeading',
-            parent=self.default_style['Heading2'],
+            parent=default_style['Heading2'],
             fontSize=14,
             spaceAfter=12,
             textColor=colors.darkblue
-        )
+        ),
+        'summary_table': TableStyle(table_commands + [('FONTSIZE', (0, 0), (-1, 0), 12)]),
+        'category_table': TableStyle(table_commands + [('FONTSIZE', (0, 0), (-1, -1), 10)])
+    }
+
+class ExportManager:
+    """Handles exporting financial data to various formats"""
+    
+    @property
+    def default_style(self):
+        """Base reportlab sample stylesheet"""
+        return _report_styles()['default']
+    
+    @property
+    def title_style(self):
+        """Paragraph style for report titles"""
+        return _report_styles()['title']
     
-    def export_to_csv(self, df: pd.DataFrame, filename: str) -> str:
-        """Export DataFrame to CSV file"""
+    @property
+    def heading_style(self):
+        """Paragraph style for report section headings"""
+        return _report_styles()['heading']
+    
+    def export_to_csv(self, df: pd.DataFrame, filename: Union[str, BinaryIO]) -> Union[str, BinaryIO]:
+        """Export DataFrame to a CSV file path or a binary buffer such as io.BytesIO"""
         try:
             # Ensure directory exists
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            if isinstance(filename, (str, os.PathLike)) and os.path.dirname(filename):
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
             
-            # Export with proper formatting
-            df.to_csv(filename, index=False, encoding='utf-8')
+            # Export with proper formatting, using Arrow's multithreaded C++ writer when available
+            table = None
+            if pyarrow is not None:
+                try:
+                    table = pyarrow.Table.from_pandas(df, preserve_index=False)
+                except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                    # Mixed-type object columns (e.g. user-added ones) do not convert; use pandas
+                    table = None
+            
+            if table is not None:
+                # Write timestamps as plain YYYY-MM-DD dates, as date_format does below
+                for i, field in enumerate(table.schema):
+                    if pyarrow.types.is_timestamp(field.type):
+                        dates = table.column(i).cast(pyarrow.date32(), safe=False)
+                        table = table.set_column(i, field.name, dates)
+                
+                # Unlike to_csv, Arrow quotes the header and every string field and writes
+                # whole floats without '.0' (3000, not 3000.0); the app's import reads both
+                pyarrow.csv.write_csv(table, filename, write_options=pyarrow.csv.WriteOptions(include_header=True))
+            else:
+                df.to_csv(filename, index=False, encoding='utf-8', date_format='%Y-%m-%d')
             return filename
         except Exception as e:
             logger.error(f"Error exporting to CSV: {e}")
             raise Exception(f"Failed to export CSV: {str(e)}")
     
-    def export_to_excel(self, df: pd.DataFrame, filename: str, sheet_name: str = "Transactions") -> str:
-        """Export DataFrame to Excel file"""
+    def export_to_excel(self, df: pd.DataFrame, filename: Union[str, BinaryIO], sheet_name: str = "Transactions") -> Union[str, BinaryIO]:
+        """Export DataFrame to an Excel file path or a binary buffer such as io.BytesIO"""
         try:
             # Ensure directory exists
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            if isinstance(filename, (str, os.PathLike)) and os.path.dirname(filename):
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
             
-            # Create Excel writer with formatting
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets[sheet_name]
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+            self._write_excel(df, filename, sheet_name)
             
             return filename
         except Exception as e:
             logger.error(f"Error exporting to Excel: {e}")
             raise Exception(f"Failed to export Excel: {str(e)}")
     
+    def _write_excel(self, df: pd.DataFrame, target, sheet_name: str = "Transactions"):
+        """Write DataFrame as an Excel sheet to a path or binary buffer"""
+        with pd.ExcelWriter(target, engine='xlsxwriter') as writer:
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+            
+            # Auto-adjust column widths from the data, not the rendered cells
+            worksheet = writer.sheets[sheet_name]
+            for i, column in enumerate(df.columns):
+                max_length = max(df[column].astype(str).str.len().max() if len(df) else 0, len(str(column)))
+                worksheet.set_column(i, i, min(max_length + 2, 50))
+    
     def create_monthly_summary(self, df: pd.DataFrame, year: int, month: int) -> Dict:
         """Create monthly summary statistics"""
         if 'Date' not in df.columns:
             return {}
         
-        # Filter data for the month
-        df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-        month_data = df[
-            (df['Date'].dt.year == year) & 
-            (df['Date'].dt.month == month)
-        ].copy()
+        # Filter data for the month with a single range comparison
+        if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+            df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+        start = pd.Timestamp(year, month, 1)
+        end = start + pd.offsets.MonthBegin(1)
+        month_data = df[(df['Date'] >= start) & (df['Date'] < end)]
         
         if len(month_data) == 0:
             return {}
         
         # Calculate summary
-        income = month_data[month_data['Amount'] > 0]['Amount'].sum()
-        expenses = abs(month_data[month_data['Amount'] < 0]['Amount'].sum())
-        net = income - expenses
+        income, expenses, net = self._income_expense(month_data['Amount'])
         
         # Category breakdown
         category_stats = {}
         if 'Category' in month_data.columns:
-            for category in month_data['Category'].unique():
-                if pd.isna(category):
-                    continue
-                cat_data = month_data[month_data['Category'] == category]
-                cat_income = cat_data[cat_data['Amount'] > 0]['Amount'].sum()
-                cat_expenses = abs(cat_data[cat_data['Amount'] < 0]['Amount'].sum())
-                
-                category_stats[category] = {
-                    'income': cat_income,
-                    'expenses': cat_expenses,
-                    'net': cat_income - cat_expenses,
-                    'count': len(cat_data)
+            for row in self._category_totals(month_data).itertuples():
+                category_stats[row.Index] = {
+                    'income': row.income,
+                    'expenses': row.expenses,
+                    'net': row.net,
+                    'count': row.count
                 }
         
         return {
@@ -134,8 +182,34 @@ class ExportManager:
             'category_stats': category_stats
         }
     
+    def _income_expense(self, amounts: pd.Series) -> Tuple[float, float, float]:
+        """Total income, expenses and net from one read of the amounts"""
+        values = amounts.to_numpy(dtype=float, na_value=np.nan)
+        income = values[values > 0].sum()
+        expenses = -values[values < 0].sum()
+        return income, expenses, income - expenses
+    
+    def _category_totals(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Income, expenses, net and count per category in a single groupby"""
+        amounts = df['Amount']
+        grouped = df.assign(
+            _pos=amounts.clip(lower=0),
+            _neg=-amounts.clip(upper=0)
+        ).groupby('Category', sort=False, observed=True, dropna=True).agg(
+            income=('_pos', 'sum'),
+            expenses=('_neg', 'sum'),
+            count=('Amount', 'size')
+        )
+        grouped['net'] = grouped['income'] - grouped['expenses']
+        return grouped
+    
     def create_pdf_report(self, df: pd.DataFrame, filename: str, title: str = "Financial Report") -> str:
         """Create PDF report with charts and summary"""
+        # reportlab is only needed here, so keep it out of the module import
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+        from reportlab.lib.units import inch
+        
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(filename), exist_ok=True)
@@ -150,9 +224,7 @@ class ExportManager:
             
             # Summary statistics
             if len(df) > 0:
-                income = df[df['Amount'] > 0]['Amount'].sum()
-                expenses = abs(df[df['Amount'] < 0]['Amount'].sum())
-                net = income - expenses
+                income, expenses, net = self._income_expense(df['Amount'])
                 
                 summary_data = [
                     ['Metric', 'Amount'],
@@ -163,16 +235,7 @@ class ExportManager:
                 ]
                 
                 summary_table = Table(summary_data, colWidths=[2*inch, 2*inch])
-                summary_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
+                summary_table.setStyle(_report_styles()['summary_table'])
                 
                 story.append(Paragraph("Summary", self.heading_style))
                 story.append(summary_table)
@@ -180,35 +243,18 @@ class ExportManager:
             
             # Category breakdown
             if 'Category' in df.columns and len(df) > 0:
-                category_stats = {}
-                for category in df['Category'].unique():
-                    if pd.isna(category):
-                        continue
-                    cat_data = df[df['Category'] == category]
-                    cat_income = cat_data[cat_data['Amount'] > 0]['Amount'].sum()
-                    cat_expenses = abs(cat_data[cat_data['Amount'] < 0]['Amount'].sum())
-                    category_stats[category] = cat_income - cat_expenses
+                category_totals = self._category_totals(df)
                 
-                if category_stats:
+                if not category_totals.empty:
                     # Sort by amount
-                    sorted_categories = sorted(category_stats.items(), key=lambda x: x[1], reverse=True)
+                    sorted_categories = category_totals.sort_values('net', ascending=False, kind='stable')
                     
                     cat_data = [['Category', 'Net Amount', 'Transaction Count']]
-                    for category, amount in sorted_categories:
-                        count = len(df[df['Category'] == category])
-                        cat_data.append([category, f"${amount:,.2f}", str(count)])
+                    for row in sorted_categories.itertuples():
+                        cat_data.append([row.Index, f"${row.net:,.2f}", str(row.count)])
                     
                     cat_table = Table(cat_data, colWidths=[2*inch, 1.5*inch, 1.5*inch])
-                    cat_table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 10),
-                        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                    ]))
+                    cat_table.setStyle(_report_styles()['category_table'])
                     
                     story.append(Paragraph("Category Breakdown", self.heading_style))
                     story.append(cat_table)
@@ -222,6 +268,18 @@ class ExportManager:
             logger.error(f"Error creating PDF report: {e}")
             raise Exception(f"Failed to create PDF report: {str(e)}")
     
+    def _csv_bytes(self, df: pd.DataFrame) -> bytes:
+        """Render DataFrame as UTF-8 CSV bytes"""
+        buffer = io.BytesIO()
+        self.export_to_csv(df, buffer)
+        return buffer.getvalue()
+    
+    def _excel_bytes(self, df: pd.DataFrame) -> bytes:
+        """Render DataFrame as Excel workbook bytes"""
+        buffer = io.BytesIO()
+        self._write_excel(df, buffer)
+        return buffer.getvalue()
+    
     def create_backup(self, df: pd.DataFrame, metadata: Dict, backup_dir: str) -> str:
         """Create timestamped backup with all data"""
         try:
@@ -232,28 +290,21 @@ class ExportManager:
             # Ensure directory exists
             os.makedirs(backup_dir, exist_ok=True)
             
-            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Add main data file
-                csv_filename = f"transactions_{timestamp}.csv"
-                csv_path = os.path.join(backup_dir, csv_filename)
-                df.to_csv(csv_path, index=False)
-                zipf.write(csv_path, csv_filename)
-                os.remove(csv_path)  # Clean up temp file
-                
-                # Add metadata
-                metadata_filename = f"metadata_{timestamp}.json"
-                metadata_path = os.path.join(backup_dir, metadata_filename)
-                with open(metadata_path, 'w') as f:
-                    json.dump(metadata, f, indent=2, default=str)
-                zipf.write(metadata_path, metadata_filename)
-                os.remove(metadata_path)  # Clean up temp file
+            # Render the three independent artifacts in parallel, then add them to the archive
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                csv_future = executor.submit(self._csv_bytes, df)
+                metadata_future = executor.submit(json.dumps, metadata, indent=2, default=str)
+                excel_future = executor.submit(self._excel_bytes, df)
                 
-                # Add Excel version
-                excel_filename = f"transactions_{timestamp}.xlsx"
-                excel_path = os.path.join(backup_dir, excel_filename)
-                self.export_to_excel(df, excel_path)
-                zipf.write(excel_path, excel_filename)
-                os.remove(excel_path)  # Clean up temp file
+                with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                    # Add main data file
+                    zipf.writestr(f"transactions_{timestamp}.csv", csv_future.result())
+                    
+                    # Add metadata
+                    zipf.writestr(f"metadata_{timestamp}.json", metadata_future.result())
+                    
+                    # Add Excel version
+                    zipf.writestr(f"transactions_{timestamp}.xlsx", excel_future.result())
             
             return backup_path
             
@@ -261,22 +312,37 @@ class ExportManager:
             logger.error(f"Error creating backup: {e}")
             raise Exception(f"Failed to create backup: {str(e)}")
     
+    def _auto_save_paths(self, save_path: str) -> Tuple[str, str]:
+        """Parquet data file and metadata sidecar paths for an auto-save location"""
+        stem = os.path.splitext(save_path)[0]
+        return f"{stem}.parquet", f"{stem}.meta.json"
+    
     def auto_save(self, df: pd.DataFrame, metadata: Dict, save_path: str) -> str:
-        """Auto-save current state to JSON file"""
+        """Auto-save current state to Parquet (or JSON when pyarrow is missing)"""
         try:
             # Ensure directory exists
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+            if os.path.dirname(save_path):
+                os.makedirs(os.path.dirname(save_path), exist_ok=True)
+            
+            timestamp = datetime.now().isoformat()
+            
+            # Columnar Parquet keeps dtypes and skips building a dict per row
+            if pyarrow is not None:
+                parquet_path, meta_path = self._auto_save_paths(save_path)
+                df.to_parquet(parquet_path, compression='zstd', index=False)
+                meta = {'metadata': metadata, 'timestamp': timestamp}
+                Path(meta_path).write_bytes(orjson.dumps(meta, default=str, option=_JSON_OPTIONS))
+                return parquet_path
             
             # Prepare data for JSON serialization
             save_data = {
                 'transactions': df.to_dict('records'),
                 'metadata': metadata,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
             
-            # Save to JSON
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, default=str)
+            # Save to JSON; orjson encodes numpy values natively and writes bytes directly
+            Path(save_path).write_bytes(orjson.dumps(save_data, default=str, option=_JSON_OPTIONS))
             
             return save_path
             
@@ -287,13 +353,23 @@ class ExportManager:
     def load_auto_save(self, save_path: str) -> Tuple[pd.DataFrame, Dict]:
         """Load auto-saved data"""
         try:
+            parquet_path, meta_path = self._auto_save_paths(save_path)
+            if pyarrow is not None and os.path.exists(parquet_path):
+                df = pd.read_parquet(parquet_path)
+                metadata = {}
+                if os.path.exists(meta_path):
+                    metadata = orjson.loads(Path(meta_path).read_bytes()).get('metadata', {})
+                
+                return df, metadata
+            
             if not os.path.exists(save_path):
                 return pd.DataFrame(columns=['Date', 'Description', 'Amount', 'Category']), {}
             
-            with open(save_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = orjson.loads(Path(save_path).read_bytes())
             
             df = pd.DataFrame(data['transactions'])
+            if 'Date' in df.columns:
+                df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
             metadata = data.get('metadata', {})
             
             return df, metadata
@@ -3,21 +3,38 @@ My Little Accountant - Personal Finance Management App
 A user-friendly web application for managing personal finances with zero coding experience required
 """
 
+import multiprocessing
+
+if __name__ == "__main__":
+    # In the frozen build a spawned PDF worker re-runs this script; freeze_support
+    # hands it to the worker loop and exits before any Streamlit code below runs
+    multiprocessing.freeze_support()
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
 import os
-import tempfile
+import io
+import re
+import functools
 import time
 from datetime import datetime, timedelta
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Import our custom modules
-from pdf_processor import process_pdf_file, process_pdf_files
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import python_calamine
+except ImportError:  # Optional speedup; falls back to pandas' openpyxl reader
+    python_calamine = None
+
+# Import our custom modules (pdf_processor and plotly load on first use)
 from data_cleaner import clean_transaction_data, validate_transaction_data
-from category_engine import CategoryEngine, categorize_transactions, get_category_suggestions
+from category_engine import CategoryEngine, categorize_transactions
 from export_utils import ExportManager
 
 # Configure Streamlit page
@@ -37,34 +54,6 @@ st.markdown("""
         text-align: center;
         margin-bottom: 2rem;
     }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1f77b4;
-        margin: 0.5rem 0;
-    }
-    .success-message {
-        background-color: #d4edda;
-        color: #155724;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border: 1px solid #c3e6cb;
-    }
-    .warning-message {
-        background-color: #fff3cd;
-        color: #856404;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border: 1px solid #ffeaa7;
-    }
-    .error-message {
-        background-color: #f8d7da;
-        color: #721c24;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border: 1px solid #f5c6cb;
-    }
     .upload-area {
         border: 2px dashed #1f77b4;
         border-radius: 0.5rem;
@@ -73,15 +62,21 @@ st.markdown("""
         background-color: #f8f9fa;
         margin: 1rem 0;
     }
-    .category-income { color: #28a745; }
-    .category-expense { color: #dc3545; }
-    .category-neutral { color: #6c757d; }
 </style>
 """, unsafe_allow_html=True)
 
+# Descriptions are stored as contiguous Arrow strings when pyarrow is available
+DESCRIPTION_DTYPE = 'string[pyarrow]' if pyarrow is not None else object
+
 # Initialize session state
 if 'transactions' not in st.session_state:
-    st.session_state.transactions = pd.DataFrame(columns=['Date', 'Description', 'Amount', 'Category'])
+    # Dates are stored as datetime64 throughout, so the dashboard never re-parses them
+    st.session_state.transactions = pd.DataFrame({
+        'Date': pd.Series(dtype='datetime64[ns]'),
+        'Description': pd.Series(dtype=DESCRIPTION_DTYPE),
+        'Amount': pd.Series(dtype=float),
+        'Category': pd.Series(dtype=object)
+    })
 if 'category_engine' not in st.session_state:
     st.session_state.category_engine = CategoryEngine()
 if 'export_manager' not in st.session_state:
@@ -91,6 +86,80 @@ if 'app_started' not in st.session_state:
 if 'help_shown' not in st.session_state:
     st.session_state.help_shown = False
 
+# Seconds between auto-saves
+AUTO_SAVE_INTERVAL = 30
+
+# Minimum seconds between per-file progress updates while processing uploads
+PROGRESS_UPDATE_INTERVAL = 0.1
+
+# Largest number of slices drawn in the spending pie
+PIE_MAX_SLICES = 20
+
+REQUIRED_COLUMNS = frozenset({'Date', 'Description', 'Amount'})
+
+@functools.lru_cache(maxsize=32)
+def search_pattern(term):
+    """Compiled case-insensitive literal pattern for a search term"""
+    return re.compile(re.escape(term), re.IGNORECASE)
+
+def apply_filters(df, search_term, category_filter, show_uncategorized):
+    """Filter transactions by search term and category with one combined mask"""
+    # Not cached: hashing the whole frame for st.cache_data costs more than the filter
+    mask = np.ones(len(df), dtype=bool)
+    
+    if search_term:
+        descriptions = df['Description']
+        if isinstance(descriptions.dtype, pd.StringDtype):
+            # Arrow's substring kernel does the case-insensitive literal match natively
+            matches = descriptions.str.contains(search_term, case=False, regex=False, na=False)
+        else:
+            matches = descriptions.str.contains(search_pattern(search_term), na=False)
+        mask &= matches.to_numpy(dtype=bool)
+    
+    if category_filter != "All Categories":
+        mask &= (df['Category'] == category_filter).to_numpy()
+    
+    if show_uncategorized:
+        mask &= (df['Category'].isna() | df['Category'].isin(['', 'Other'])).to_numpy()
+    
+    return df.loc[mask]
+
+def read_csv_upload(uploaded_file):
+    """Read an uploaded CSV, using Arrow's multithreaded parser when available"""
+    if pyarrow is not None:
+        try:
+            return pd.read_csv(uploaded_file, engine='pyarrow')
+        except ValueError:
+            # A file Arrow can't parse falls back to the C engine below
+            uploaded_file.seek(0)
+    
+    # Read only the needed columns
+    return pd.read_csv(uploaded_file, usecols=lambda column: column.title() in REQUIRED_COLUMNS)
+
+def read_excel_upload(uploaded_file):
+    """Read an uploaded workbook's first sheet, using the Rust calamine parser when available"""
+    if python_calamine is not None:
+        try:
+            rows = python_calamine.CalamineWorkbook.from_filelike(uploaded_file).get_sheet_by_index(0).to_python(skip_empty_area=True)
+        except python_calamine.CalamineError:
+            # A workbook calamine can't read falls back to openpyxl below
+            uploaded_file.seek(0)
+        else:
+            if not rows:
+                return pd.DataFrame()
+            # Empty cells come back as '', where read_excel gives NaN
+            df = pd.DataFrame(rows[1:], columns=[str(column) for column in rows[0]])
+            return df.replace('', np.nan).infer_objects()
+    
+    return pd.read_excel(uploaded_file)
+
+# Readers for tabular uploads, by file extension
+TABLE_READERS = {
+    '.csv': ('CSV', read_csv_upload),
+    '.xlsx': ('Excel', read_excel_upload),
+    '.xls': ('Excel', read_excel_upload),
+}
+
 def load_sample_data():
     """Load sample data for demonstration"""
     sample_data = {
@@ -108,7 +177,30 @@ def load_sample_data():
                    'Food & Dining', 'Utilities', 'Food & Dining', 'Shopping', 
                    'Transportation', 'Utilities']
     }
-    return pd.DataFrame(sample_data)
+    sample_df = pd.DataFrame(sample_data)
+    sample_df['Date'] = pd.to_datetime(sample_df['Date'])
+    sample_df['Description'] = sample_df['Description'].astype(DESCRIPTION_DTYPE)
+    sample_df['Category'] = sample_df['Category'].astype(st.session_state.category_engine.category_dtype)
+    return sample_df
+
+@st.cache_data(show_spinner=False)
+def sample_csv():
+    """Sample transactions as CSV text, built once and reused across downloads"""
+    return load_sample_data().to_csv(index=False, date_format='%Y-%m-%d')
+
+@st.cache_data(show_spinner=False)
+def sample_excel():
+    """Sample transactions as Excel bytes, rendered in memory once and reused"""
+    excel_buffer = io.BytesIO()
+    ExportManager().export_to_excel(load_sample_data(), excel_buffer)
+    return excel_buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def transactions_csv(df):
+    """Transactions as CSV bytes, reused across clicks while the data is unchanged"""
+    csv_buffer = io.BytesIO()
+    ExportManager().export_to_csv(df, csv_buffer)
+    return csv_buffer.getvalue()
 
 def show_welcome_tour():
     """Show welcome tour for first-time users"""
@@ -136,20 +228,19 @@ def show_welcome_tour():
 def process_uploaded_files(uploaded_files):
     """Process uploaded files with enhanced speed and progress tracking"""
     start_time = time.time()
-    all_data = []
+    # Collect each file's columns separately; they are combined column by column at the end
+    all_data = {column: [] for column in ('Date', 'Description', 'Amount')}
+    file_count = 0
     pdf_files = []
-    csv_files = []
-    excel_files = []
+    table_files = []
     
     # Separate files by type
     for uploaded_file in uploaded_files:
-        file_extension = uploaded_file.name.split('.')[-1].lower()
-        if file_extension == 'pdf':
+        file_extension = os.path.splitext(uploaded_file.name)[1].lower()
+        if file_extension == '.pdf':
             pdf_files.append(uploaded_file)
-        elif file_extension == 'csv':
-            csv_files.append(uploaded_file)
-        elif file_extension in ['xlsx', 'xls']:
-            excel_files.append(uploaded_file)
+        elif file_extension in TABLE_READERS:
+            table_files.append((uploaded_file, *TABLE_READERS[file_extension]))
     
     # Enhanced progress tracking
     progress_bar = st.progress(0)
@@ -160,9 +251,18 @@ def process_uploaded_files(uploaded_files):
     total_files = len(uploaded_files)
     processed_files = 0
     
-    def update_progress(message, progress, details=""):
+    last_update = 0.0
+    
+    def update_progress(message, progress, details="", throttle=False):
         """Update progress with time estimation"""
-        elapsed_time = time.time() - start_time
+        nonlocal last_update
+        # Per-file updates each send four elements to the browser; cap them at ~10 per second
+        now = time.time()
+        if throttle and now - last_update < PROGRESS_UPDATE_INTERVAL:
+            return
+        last_update = now
+        
+        elapsed_time = now - start_time
         if progress > 0:
             estimated_total = elapsed_time / (progress / 100)
             remaining_time = estimated_total - elapsed_time
@@ -176,66 +276,68 @@ def process_uploaded_files(uploaded_files):
     
     update_progress("Starting file processing...", 0, f"Processing {total_files} files")
     
-    # Process CSV files with progress tracking
-    for i, uploaded_file in enumerate(csv_files):
-        update_progress(f"Processing CSV: {uploaded_file.name}", (processed_files / total_files) * 100, f"CSV file {i+1}/{len(csv_files)}")
-        try:
-            df = pd.read_csv(uploaded_file)
-            # Standardize column names
-            df.columns = df.columns.str.title()
-            if 'Date' in df.columns and 'Description' in df.columns and 'Amount' in df.columns:
-                all_data.append(df[['Date', 'Description', 'Amount']])
-                update_progress(f"✅ CSV processed: {len(df)} transactions", (processed_files / total_files) * 100, f"Found {len(df)} transactions")
-            else:
-                st.warning(f"⚠️ {uploaded_file.name} doesn't have the expected columns (Date, Description, Amount)")
-        except Exception as e:
-            st.error(f"❌ Error processing {uploaded_file.name}: {str(e)}")
-        processed_files += 1
+    # Process CSV and Excel files on worker threads while this thread reports progress.
+    # Only the pyarrow CSV and calamine Excel readers release the GIL and parse in
+    # parallel; the openpyxl and python-engine CSV fallbacks hold it and run one at a time
+    table_frames = [None] * len(table_files)
+    if table_files:
+        with ThreadPoolExecutor(max_workers=min(4, len(table_files))) as executor:
+            futures = {
+                executor.submit(reader, uploaded_file): i
+                for i, (uploaded_file, _, reader) in enumerate(table_files)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                uploaded_file, file_type, _ = table_files[futures[future]]
+                update_progress(f"Processing {file_type}: {uploaded_file.name}", (processed_files / total_files) * 100, f"{file_type} file {done}/{len(table_files)}", throttle=True)
+                try:
+                    df = future.result()
+                    # Standardize column names
+                    df.columns = df.columns.str.title()
+                    if REQUIRED_COLUMNS.issubset(df.columns):
+                        table_frames[futures[future]] = df
+                        file_count += 1
+                        update_progress(f"✅ {file_type} processed: {len(df)} transactions", (processed_files / total_files) * 100, f"Found {len(df)} transactions", throttle=True)
+                    else:
+                        st.warning(f"⚠️ {uploaded_file.name} doesn't have the expected columns (Date, Description, Amount)")
+                except Exception as e:
+                    st.error(f"❌ Error processing {uploaded_file.name}: {str(e)}")
+                processed_files += 1
     
-    # Process Excel files with progress tracking
-    for i, uploaded_file in enumerate(excel_files):
-        update_progress(f"Processing Excel: {uploaded_file.name}", (processed_files / total_files) * 100, f"Excel file {i+1}/{len(excel_files)}")
-        try:
-            df = pd.read_excel(uploaded_file)
-            df.columns = df.columns.str.title()
-            if 'Date' in df.columns and 'Description' in df.columns and 'Amount' in df.columns:
-                all_data.append(df[['Date', 'Description', 'Amount']])
-                update_progress(f"✅ Excel processed: {len(df)} transactions", (processed_files / total_files) * 100, f"Found {len(df)} transactions")
-            else:
-                st.warning(f"⚠️ {uploaded_file.name} doesn't have the expected columns (Date, Description, Amount)")
-        except Exception as e:
-            st.error(f"❌ Error processing {uploaded_file.name}: {str(e)}")
-        processed_files += 1
+    # Keep upload order regardless of which file finished first
+    for df in table_frames:
+        if df is not None:
+            for column, parts in all_data.items():
+                parts.append(df[column])
     
     # Process PDF files with enhanced progress tracking
     if pdf_files:
+        from pdf_processor import process_pdf_files
+        
         update_progress("Processing PDF files...", (processed_files / total_files) * 100, f"PDF files: {len(pdf_files)}")
         try:
-            # Save PDFs to temporary files
-            temp_pdf_paths = []
-            for uploaded_file in pdf_files:
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                    tmp_file.write(uploaded_file.getvalue())
-                    temp_pdf_paths.append(tmp_file.name)
-            
             # Enhanced PDF progress callback
-            def pdf_progress_callback(message, progress, details):
+            def pdf_progress_callback(message, progress, details, throttle=False):
                 # Map PDF progress to overall progress (processed_files to 100%)
                 pdf_progress_start = (processed_files / total_files) * 100
                 pdf_progress_end = 100
                 overall_progress = pdf_progress_start + (pdf_progress_end - pdf_progress_start) * (progress / 100)
-                update_progress(message, overall_progress, details)
+                update_progress(message, overall_progress, details, throttle)
             
-            pdf_df = process_pdf_files(temp_pdf_paths, pdf_progress_callback)
-            if not pdf_df.empty:
-                all_data.append(pdf_df)
+            # pdfplumber reads from file-like objects, so the uploaded bytes go to the
+            # PDF worker processes in memory, named after the upload for progress messages
+            pdf_buffers = []
+            for uploaded_file in pdf_files:
+                buffer = io.BytesIO(uploaded_file.getvalue())
+                buffer.name = uploaded_file.name
+                pdf_buffers.append(buffer)
             
-            # Clean up temporary files
-            for temp_path in temp_pdf_paths:
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
+            pdf_df = process_pdf_files(pdf_buffers, pdf_progress_callback)
+            if not pdf_df.empty:
+                for column, parts in all_data.items():
+                    parts.append(pdf_df[column])
+                file_count += 1
+            else:
+                st.warning("⚠️ No transactions were found in the uploaded PDF files")
                     
         except Exception as e:
             st.error(f"❌ Error processing PDF files: {str(e)}")
@@ -243,9 +345,11 @@ def process_uploaded_files(uploaded_files):
         processed_files += len(pdf_files)
     
     # Combine all data with progress tracking
-    if all_data:
-        update_progress("Combining all data...", 95, f"Combining {len(all_data)} file(s)")
-        combined_df = pd.concat(all_data, ignore_index=True)
+    if file_count:
+        update_progress("Combining all data...", 95, f"Combining {file_count} file(s)")
+        combined_df = pd.DataFrame({
+            column: pd.concat(parts, ignore_index=True) for column, parts in all_data.items()
+        })
         
         # Clean the data with progress tracking
         update_progress("Cleaning and validating data...", 96, f"Processing {len(combined_df)} transactions")
@@ -263,6 +367,15 @@ def process_uploaded_files(uploaded_files):
         update_progress("Auto-categorizing transactions...", 98, f"Analyzing {len(cleaned_df)} transactions")
         categorized_df = categorize_transactions(cleaned_df)
         
+        # Store categories as integer codes over the session engine's category list,
+        # keeping any labels from the upload that the engine does not know
+        engine = st.session_state.category_engine
+        categorized_df['Category'] = categorized_df['Category'].astype(engine.category_dtype_for(categorized_df['Category']))
+        categorized_df['Description'] = categorized_df['Description'].astype(DESCRIPTION_DTYPE)
+        
+        # Keep transactions in date order; the dashboard slices months from the sorted column
+        categorized_df = categorized_df.sort_values('Date', kind='stable', ignore_index=True)
+        
         total_time = time.time() - start_time
         update_progress("✅ Processing complete!", 100, f"Processed {len(categorized_df)} transactions in {total_time:.2f}s")
         
@@ -300,29 +413,14 @@ def display_transaction_table(df):
     with col2:
         category_filter = st.selectbox(
             "Filter by category",
-            ["All Categories"] + list(st.session_state.category_engine.categories.keys()),
+            ("All Categories",) + st.session_state.category_engine.category_names,
             key="category_filter"
         )
     
     with col3:
         show_uncategorized = st.checkbox("Show uncategorized only", value=False, key="uncategorized_filter")
     
-    # Apply filters with caching for better performance
-    @st.cache_data(ttl=60)  # Cache for 1 minute
-    def apply_filters(df, search_term, category_filter, show_uncategorized):
-        filtered_df = df.copy()
-        
-        if search_term:
-            filtered_df = filtered_df[filtered_df['Description'].str.contains(search_term, case=False, na=False)]
-        
-        if category_filter != "All Categories":
-            filtered_df = filtered_df[filtered_df['Category'] == category_filter]
-        
-        if show_uncategorized:
-            filtered_df = filtered_df[(filtered_df['Category'].isna()) | (filtered_df['Category'] == '') | (filtered_df['Category'] == 'Other')]
-        
-        return filtered_df
-    
+    # Apply filters
     filtered_df = apply_filters(df, search_term, category_filter, show_uncategorized)
     
     # Performance info
@@ -341,7 +439,7 @@ def display_transaction_table(df):
         with col2:
             bulk_category = st.selectbox(
                 "Bulk assign category",
-                [""] + list(st.session_state.category_engine.categories.keys()),
+                ("",) + st.session_state.category_engine.category_names,
                 key="bulk_category"
             )
         
@@ -349,19 +447,14 @@ def display_transaction_table(df):
             if st.button("🚀 Apply to Selected", disabled=not bulk_category, type="primary"):
                 if select_all:
                     start_time = time.time()
-                    indices = filtered_df.index.tolist()
-                    
-                    # Progress bar for bulk operations
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
+                    indices = filtered_df.index.to_numpy()
                     
-                    for i, idx in enumerate(indices):
-                        st.session_state.transactions.loc[idx, 'Category'] = bulk_category
-                        if i % max(1, len(indices) // 20) == 0:  # Update every 5%
-                            progress_bar.progress((i + 1) / len(indices))
-                            status_text.text(f"Updating {i + 1}/{len(indices)} transactions...")
+                    # One assignment for all rows; on the categorical column this writes integer codes
+                    st.session_state.category_engine.bulk_categorize(
+                        st.session_state.transactions, bulk_category, indices
+                    )
                     
-                    progress_bar.progress(1.0)
+                    status_text = st.empty()
                     status_text.text(f"✅ Completed in {time.time() - start_time:.2f}s")
                     
                     st.success(f"✅ Assigned '{bulk_category}' to {len(indices)} transactions")
@@ -370,25 +463,19 @@ def display_transaction_table(df):
         with col4:
             # Smart categorization suggestions
             if st.button("🤖 Smart Categorize", help="Use AI to categorize uncategorized transactions"):
-                uncategorized = filtered_df[(filtered_df['Category'].isna()) | (filtered_df['Category'] == '') | (filtered_df['Category'] == 'Other')]
+                uncategorized = filtered_df[filtered_df['Category'].isna() | filtered_df['Category'].isin(['', 'Other'])]
                 
                 if len(uncategorized) > 0:
-                    progress_bar = st.progress(0)
                     status_text = st.empty()
                     
                     start_time = time.time()
                     
-                    for i, idx in enumerate(uncategorized.index):
-                        suggestions = get_category_suggestions(uncategorized.loc[idx, 'Description'])
-                        if suggestions:
-                            best_category = suggestions[0]
-                            st.session_state.transactions.loc[idx, 'Category'] = best_category
-                        
-                        if i % max(1, len(uncategorized) // 20) == 0:
-                            progress_bar.progress((i + 1) / len(uncategorized))
-                            status_text.text(f"Smart categorizing {i + 1}/{len(uncategorized)} transactions...")
+                    # Score all descriptions in one batch on the session engine, then write
+                    # every suggested category in one assignment
+                    suggested = st.session_state.category_engine.suggest_categories(uncategorized['Description']).dropna()
+                    if len(suggested) > 0:
+                        st.session_state.transactions.loc[suggested.index, 'Category'] = suggested.to_numpy()
                     
-                    progress_bar.progress(1.0)
                     status_text.text(f"✅ Smart categorization completed in {time.time() - start_time:.2f}s")
                     
                     st.success(f"🤖 Smart categorized {len(uncategorized)} transactions")
@@ -419,7 +506,8 @@ def display_transaction_table(df):
         
         # Create editable table with enhanced performance
         table_start = time.time()
-        edited_df = st.data_editor(
+        editor_key = f"transaction_editor_{page if total_pages > 1 else 0}"
+        st.data_editor(
             page_df,
             column_config={
                 "Date": st.column_config.DateColumn(
@@ -440,29 +528,44 @@ def display_transaction_table(df):
                 "Category": st.column_config.SelectboxColumn(
                     "Category",
                     help="Transaction category",
-                    options=list(st.session_state.category_engine.categories.keys()),
+                    options=st.session_state.category_engine.category_names,
                     required=True
                 )
             },
             hide_index=True,
             use_container_width=True,
-            key=f"transaction_editor_{page if total_pages > 1 else 0}"
+            key=editor_key
         )
         
         table_time = time.time() - table_start
         
-        # Update session state with changes
-        if not edited_df.equals(page_df):
+        # Update session state with only the cells the editor reports as changed
+        # (edited_rows maps page row positions to {column: new value})
+        edited_rows = st.session_state[editor_key].get('edited_rows', {})
+        if edited_rows:
             update_start = time.time()
-            for idx in edited_df.index:
-                if idx in page_df.index:
-                    st.session_state.transactions.loc[idx] = edited_df.loc[idx]
+            
+            # Group the changed cells by column, then write each column in one assignment
+            column_edits = {}
+            for row, changes in edited_rows.items():
+                idx = page_df.index[int(row)]
+                for column, value in changes.items():
+                    column_edits.setdefault(column, {})[idx] = value
+            
+            for column, edits in column_edits.items():
+                values = list(edits.values())
+                # The editor returns JSON values: ISO date strings and plain numbers/None
+                if column == 'Date':
+                    values = pd.to_datetime(values)
+                elif column == 'Amount':
+                    values = pd.to_numeric(values)
+                st.session_state.transactions.loc[list(edits.keys()), column] = values
             
             update_time = time.time() - update_start
             st.info(f"⚡ Table rendered in {table_time:.3f}s | Updates applied in {update_time:.3f}s")
     
     # Enhanced progress indicator with performance metrics
-    progress_stats = st.session_state.category_engine.get_progress_stats(df)
+    progress_stats = _progress_stats(df)
     progress_percentage = progress_stats['progress_percentage']
     
     col1, col2, col3 = st.columns([2, 1, 1])
@@ -477,14 +580,40 @@ def display_transaction_table(df):
     with col3:
         st.metric("Remaining", progress_stats['total_transactions'] - progress_stats['categorized'])
 
-@st.cache_data(ttl=300)  # Cache dashboard calculations for 5 minutes
+@st.cache_data(show_spinner=False, max_entries=8)
+def _compute_progress_stats(category_df, _engine):
+    """Categorization progress, cached on the Category column alone"""
+    return _engine.get_progress_stats(category_df)
+
+def _progress_stats(df):
+    """Categorization progress for the transactions, shared by the table and dashboard"""
+    # Only Category affects the result, so hash just that column (keeping the row count)
+    return _compute_progress_stats(df.loc[:, df.columns.intersection(['Category'])], st.session_state.category_engine)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _compute_category_stats(df, categories, _engine):
+    """Per-category statistics frame, cached on the frame and the engine's category list"""
+    return _engine.get_category_stats_frame(df)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _monthly_agg(df):
+    """Net flow and transaction count per (year, month) from a single groupby"""
+    dates = df['Date']
+    return df.groupby([
+        dates.dt.year.astype('Int64').rename('Year'),
+        dates.dt.month.astype('Int64').rename('Month')
+    ]).agg(
+        Net_Flow=('Amount', 'sum'),
+        Transaction_Count=('Amount', 'count')
+    ).round(2)
+
 def calculate_dashboard_metrics(df):
-    """Calculate dashboard metrics with caching for better performance"""
+    """Calculate dashboard metrics, reusing cached results across reruns"""
     start_time = time.time()
     
     # Calculate summary metrics
     validation = validate_transaction_data(df)
-    progress_stats = st.session_state.category_engine.get_progress_stats(df)
+    progress_stats = _progress_stats(df)
     
     calculation_time = time.time() - start_time
     
@@ -500,6 +629,10 @@ def display_dashboard(df):
         st.info("📊 Upload and categorize transactions to see your financial dashboard!")
         return
     
+    # Plotly is only needed once there is data to chart
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
     # Performance tracking
     dashboard_start = time.time()
     
@@ -551,25 +684,34 @@ def display_dashboard(df):
     
     with col1:
         if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-            years = sorted(df['Date'].dt.year.dropna().unique())
+            # Dates are parsed once at ingestion (cleaning, sample data, auto-save load)
+            monthly_agg = _monthly_agg(df)
+            years = list(monthly_agg.index.get_level_values('Year').unique())
             selected_year = st.selectbox("Select Year", years, index=len(years)-1 if years else 0)
             
-            # Filter by year
-            yearly_df = df[df['Date'].dt.year == selected_year]
+            # Months of the selected year, by index lookup rather than a scan over the rows
+            yearly_agg = monthly_agg.loc[selected_year] if years else monthly_agg.iloc[:0]
         else:
-            yearly_df = df
+            yearly_agg = pd.DataFrame()
     
     with col2:
-        if len(yearly_df) > 0:
-            months = sorted(yearly_df['Date'].dt.month.dropna().unique())
+        if len(yearly_agg) > 0:
+            months = list(yearly_agg.index)
             month_names = [datetime(1, m, 1).strftime('%B') for m in months]
             selected_month = st.selectbox("Select Month", month_names, index=len(month_names)-1 if month_names else 0)
             
-            # Filter by month
-            monthly_df = yearly_df[yearly_df['Date'].dt.month == months[month_names.index(selected_month)] if month_names else 0]
+            # Filter by month with a single range comparison
+            month_start = pd.Timestamp(selected_year, months[month_names.index(selected_month)], 1)
+            month_end = month_start + pd.offsets.MonthBegin(1)
+            dates = df['Date']
+            if dates.is_monotonic_increasing:
+                # Date-sorted data (as stored after upload) slices the month by binary search
+                start, end = dates.searchsorted([month_start, month_end])
+                monthly_df = df.iloc[start:end]
+            else:
+                monthly_df = df[(dates >= month_start) & (dates < month_end)]
         else:
-            monthly_df = yearly_df
+            monthly_df = df.iloc[:0]
     
     # Charts
     col1, col2 = st.columns(2)
@@ -577,15 +719,22 @@ def display_dashboard(df):
     with col1:
         # Category breakdown (pie chart)
         if len(monthly_df) > 0 and 'Category' in monthly_df.columns:
-            category_stats = st.session_state.category_engine.get_category_stats(monthly_df)
+            category_stats = _compute_category_stats(monthly_df, st.session_state.category_engine.category_names, st.session_state.category_engine)
             
-            if category_stats:
-                categories = list(category_stats.keys())
-                amounts = [abs(stats['expense_amount']) for stats in category_stats.values()]
+            if not category_stats.empty:
+                pie_amounts = category_stats['expense_amount'].abs()
+                if len(pie_amounts) > PIE_MAX_SLICES:
+                    # Fold the smallest categories into "Other" so the pie stays readable
+                    pie_amounts = pie_amounts.sort_values(ascending=False)
+                    tail = pie_amounts.iloc[PIE_MAX_SLICES - 1:]
+                    pie_amounts = pd.concat([
+                        pie_amounts.iloc[:PIE_MAX_SLICES - 1],
+                        pd.Series({'Other': tail.sum()})
+                    ]).groupby(level=0, sort=False).sum()
                 
                 fig_pie = px.pie(
-                    values=amounts,
-                    names=categories,
+                    values=pie_amounts,
+                    names=pie_amounts.index,
                     title=f"Spending by Category - {selected_month} {selected_year}",
                     color_discrete_sequence=px.colors.qualitative.Set3
                 )
@@ -594,14 +743,9 @@ def display_dashboard(df):
     
     with col2:
         # Monthly trend (line chart)
-        if len(yearly_df) > 0:
-            # Group by month
-            monthly_summary = yearly_df.groupby(yearly_df['Date'].dt.month).agg({
-                'Amount': ['sum', 'count']
-            }).round(2)
-            
-            monthly_summary.columns = ['Net_Flow', 'Transaction_Count']
-            monthly_summary.index = [datetime(1, m, 1).strftime('%B') for m in monthly_summary.index]
+        if len(yearly_agg) > 0:
+            # Monthly totals for the selected year, labelled by month name
+            monthly_summary = yearly_agg.set_axis([datetime(1, m, 1).strftime('%B') for m in yearly_agg.index])
             
             fig_line = go.Figure()
             fig_line.add_trace(go.Scatter(
@@ -624,25 +768,28 @@ def display_dashboard(df):
     # Category breakdown table
     if len(monthly_df) > 0 and 'Category' in monthly_df.columns:
         st.markdown("### 📋 Category Breakdown")
-        category_stats = st.session_state.category_engine.get_category_stats(monthly_df)
-        
-        if category_stats:
-            category_data = []
-            for category, stats in category_stats.items():
-                category_data.append({
-                    'Category': category,
-                    'Transactions': stats['count'],
-                    'Income': f"${stats['income_amount']:,.2f}",
-                    'Expenses': f"${stats['expense_amount']:,.2f}",
-                    'Net': f"${stats['total_amount']:,.2f}"
-                })
-            
-            category_df = pd.DataFrame(category_data)
+        category_stats = _compute_category_stats(monthly_df, st.session_state.category_engine.category_names, st.session_state.category_engine)
+        
+        if not category_stats.empty:
+            money = '${:,.2f}'.format
+            category_df = pd.DataFrame({
+                'Category': category_stats.index,
+                'Transactions': category_stats['count'].to_numpy(),
+                'Income': category_stats['income_amount'].map(money).to_numpy(),
+                'Expenses': category_stats['expense_amount'].map(money).to_numpy(),
+                'Net': category_stats['total_amount'].map(money).to_numpy()
+            })
             st.dataframe(category_df, use_container_width=True, hide_index=True)
 
 def auto_save_data():
     """Auto-save data every 30 seconds"""
+    # Every rerun reaches here, so only write once the interval has elapsed
+    now = time.monotonic()
+    if now - st.session_state.get('last_save_ts', float('-inf')) < AUTO_SAVE_INTERVAL:
+        return
+    
     if not st.session_state.transactions.empty:
+        st.session_state.last_save_ts = now
         try:
             save_path = "my_finances.json"
             metadata = {
@@ -682,7 +829,7 @@ def main():
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    csv_data = st.session_state.transactions.to_csv(index=False)
+                    csv_data = transactions_csv(st.session_state.transactions)
                     st.download_button(
                         label="📄 CSV",
                         data=csv_data,
@@ -692,30 +839,18 @@ def main():
                 
                 with col2:
                     try:
-                        import tempfile
-                        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
-                            excel_path = tmp_file.name
-                        
+                        excel_buffer = io.BytesIO()
                         st.session_state.export_manager.export_to_excel(
                             st.session_state.transactions, 
-                            excel_path
+                            excel_buffer
                         )
                         
-                        with open(excel_path, 'rb') as f:
-                            excel_data = f.read()
-                        
                         st.download_button(
                             label="📊 Excel",
-                            data=excel_data,
+                            data=excel_buffer.getvalue(),
                             file_name=f"transactions_{timestamp}.xlsx",
                             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                         )
-                        
-                        # Clean up temporary file
-                        try:
-                            os.unlink(excel_path)
-                        except:
-                            pass
                             
                     except Exception as e:
                         st.error(f"Could not create Excel export: {str(e)}")
@@ -811,39 +946,21 @@ def main():
             st.markdown("**Try these sample files to see the expected format:**")
             
             # Create sample CSV
-            sample_df = load_sample_data()
-            csv_sample = sample_df.to_csv(index=False)
             st.download_button(
                 label="📄 Download Sample CSV",
-                data=csv_sample,
+                data=sample_csv(),
                 file_name="sample_transactions.csv",
                 mime="text/csv"
             )
             
             # Create sample Excel
             try:
-                import tempfile
-                with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
-                    excel_path = tmp_file.name
-                
-                st.session_state.export_manager.export_to_excel(sample_df, excel_path)
-                
-                with open(excel_path, 'rb') as f:
-                    excel_data = f.read()
-                
                 st.download_button(
                     label="📊 Download Sample Excel",
-                    data=excel_data,
+                    data=sample_excel(),
                     file_name="sample_transactions.xlsx",
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                 )
-                
-                # Clean up temporary file
-                import os
-                try:
-                    os.unlink(excel_path)
-                except:
-                    pass
                     
             except Exception as e:
                 st.error(f"Could not create sample Excel file: {str(e)}")
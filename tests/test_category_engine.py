@@ -0,0 +1,31 @@
+"""Tests for category suggestions"""
+
+import pandas as pd
+import pytest
+
+from category_engine import CategoryEngine
+
+
+@pytest.fixture(params=['automaton', 'scan'])
+def engine(request):
+    engine = CategoryEngine()
+    if request.param == 'scan':
+        engine._suggestion_automaton = None
+    return engine
+
+
+@pytest.mark.parametrize('description, expected', [
+    ('gas bill payment', [('Utilities', 1.0), ('Transportation', 1.0)]),
+    ('HOME DEPOT', [('Housing', 1.0), ('Shopping', 1.0)]),
+    ('rental car', [('Housing', 1.0), ('Travel', 1.0)]),
+    ('training', [('Transportation', 1.0), ('Education', 1.0)]),
+    ('booking', [('Education', 1.0), ('Travel', 1.0)]),
+    ('xgas billy', [('Transportation', 1.0), ('Utilities', 0.8)]),
+])
+def test_suggestions_include_overlapping_keywords(engine, description, expected):
+    assert engine.get_suggestions(description) == expected
+
+
+def test_suggest_categories_uses_top_suggestion(engine):
+    best = engine.suggest_categories(pd.Series(['xgas billy', 'nothing here']))
+    assert best.tolist() == ['Transportation', None]
@@ -0,0 +1,79 @@
+"""Tests that PDFium and pdfplumber text feed the statement parser the same transactions"""
+
+import io
+
+import pytest
+
+pytest.importorskip('reportlab')
+pytest.importorskip('pypdfium2')
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+import pdf_processor
+from pdf_processor import BankPDFProcessor
+
+BANK_HEADERS = {
+    'chase': 'JPMorgan Chase Bank, N.A. - Account Statement',
+    'bank_of_america': 'Bank of America Checking Statement',
+    'wells_fargo': 'Wells Fargo Everyday Checking',
+    'citibank': 'Citibank Account Statement',
+    'hsbc_bermuda': 'HSBC Bank Bermuda Limited',
+    'butterfield_bermuda': 'Butterfield Bank Statement',
+    'generic': 'Monthly Account Statement',
+}
+
+
+def _statement_pdf(header: str) -> bytes:
+    """Two-page statement with date, description and amount in separate columns"""
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter)
+    pdf.drawString(50, 750, header)
+    pdf.drawString(50, 720, 'DATE')
+    pdf.drawString(150, 720, 'DESCRIPTION')
+    pdf.drawString(400, 720, 'AMOUNT')
+    y = 700
+    for day in range(1, 21):
+        pdf.drawString(50, y, f'01/{day:02d}/2024')
+        pdf.drawString(150, y, f'GROCERY STORE #{day}')
+        pdf.drawRightString(480, y, f'-{day * 3},{day:03d}.45' if day % 5 == 0 else f'-{day}.75')
+        y -= 20
+    pdf.drawString(50, y, '01/31/2024')
+    pdf.drawString(150, y, 'PAYROLL DEPOSIT')
+    pdf.drawRightString(480, y, '$2,500.00')
+    pdf.showPage()
+    pdf.drawString(50, 750, 'Continued')
+    pdf.drawString(50, 700, '02/01/2024')
+    pdf.drawString(150, 700, 'SHELL GAS STATION')
+    pdf.drawRightString(480, 700, '-40.12')
+    pdf.save()
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('bank', sorted(BANK_HEADERS))
+def test_pdfium_and_pdfplumber_text_parse_alike(bank, monkeypatch):
+    data = _statement_pdf(BANK_HEADERS[bank])
+    processor = BankPDFProcessor()
+    
+    pdfium_df = processor.process_pdf(io.BytesIO(data))
+    monkeypatch.setattr(pdf_processor, 'pypdfium2', None)
+    pdfplumber_df = processor.process_pdf(io.BytesIO(data))
+    
+    assert len(pdfium_df) == 22
+    assert pdfium_df.equals(pdfplumber_df)
+
+
+def test_bank_detected_from_pdfium_text():
+    for bank, header in BANK_HEADERS.items():
+        text = BankPDFProcessor().extract_text_from_pdf(io.BytesIO(_statement_pdf(header)))
+        assert BankPDFProcessor().detect_bank(text) == bank
+
+
+def test_pdfium_leaves_buffer_position_alone():
+    buffer = io.BytesIO(_statement_pdf(BANK_HEADERS['generic']))
+    buffer.seek(7)
+    extractor, page_texts = BankPDFProcessor()._page_text_source(buffer, [])
+    
+    assert extractor.startswith('pypdfium2')
+    assert len(list(page_texts)) == 2
+    assert buffer.tell() == 7